@@ -18,18 +18,133 @@ Author: Claude
 """
 
 import os
+import re
 import sys
+import glob
+import struct
 import time
 import json
+import shutil
+import tempfile
 import subprocess
 import platform
+import queue
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
+# Report layout, built once and shared by every header and report
+REPORT_WIDTH = 70
+BAR = "=" * REPORT_WIDTH
+DASH = "-" * REPORT_WIDTH
+TABLE_RULE = "  " + "-" * (REPORT_WIDTH - 4)
+
+# HDMI versions and their maximum bandwidth in Gbps, sorted ascending so a
+# mode that fits one version fits every later one too
+HDMI_VERSIONS = (
+    ("HDMI 1.4", 10.2),
+    ("HDMI 2.0", 18.0),
+    ("HDMI 2.1", 48.0),
+)
+HDMI_MAX_BANDWIDTHS = tuple(max_bw for _, max_bw in HDMI_VERSIONS)
+
+# Clear screen and move the cursor home, without spawning cls/clear
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+STD_OUTPUT_HANDLE = -11
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# Marks the end of a command's output in the persistent PowerShell session
+PS_SENTINEL = "---END---"
+# Seconds to wait for one command's output before the session is killed
+PS_SESSION_TIMEOUT = 2.0
+
+# SWbemServices.ExecQuery flags: don't keep enumerated objects for rewind,
+# and return the enumerator before the query finishes
+WBEM_FLAG_FORWARD_ONLY = 0x20
+WBEM_FLAG_RETURN_IMMEDIATELY = 0x10
+
+EDID_HEADER = b"\x00\xff\xff\xff\xff\xff\xff\x00"
+
+
+def _pump_lines(stream, lines: "queue.Queue[Optional[str]]"):
+    """Copy lines from a text stream into a queue, then None once it closes"""
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def decode_wmi_string(codes: Optional[List[int]]) -> str:
+    """Decode a zero-padded WmiMonitorID character-code array into a string"""
+    return bytes(c for c in codes or () if 0 < c < 128).decode("ascii").strip()
+
+
+def parse_edid(edid: bytes) -> Dict:
+    """Decode the identity and preferred timing from a 128-byte base EDID block"""
+    if len(edid) < 128 or edid[:8] != EDID_HEADER:
+        raise ValueError("Not a valid EDID block")
+
+    # Manufacturer ID is three 5-bit letters packed big-endian ('A' == 1)
+    mfg_id, = struct.unpack_from(">H", edid, 8)
+    product_code, serial_number = struct.unpack_from("<HI", edid, 10)
+
+    info = {
+        "manufacturer": "".join(chr(((mfg_id >> shift) & 0x1F) + 64) for shift in (10, 5, 0)),
+        "product_code": f"0x{product_code:04X}",
+        "manufacture_year": edid[17] + 1990,
+        "edid_version": f"{edid[18]}.{edid[19]}",
+    }
+    if serial_number:
+        info["serial"] = str(serial_number)
+
+    # Four 18-byte descriptors: detailed timings or text descriptors
+    for offset in (54, 72, 90, 108):
+        pixel_clock, h_active_lo, h_blank_lo, h_hi, v_active_lo, v_blank_lo, v_hi = \
+            struct.unpack_from("<H6B", edid, offset)
+
+        if pixel_clock:
+            # The first detailed timing is the display's preferred mode
+            if "preferred_mode" not in info:
+                h_active = h_active_lo | (h_hi & 0xF0) << 4
+                h_total = h_active + (h_blank_lo | (h_hi & 0x0F) << 8)
+                v_active = v_active_lo | (v_hi & 0xF0) << 4
+                v_total = v_active + (v_blank_lo | (v_hi & 0x0F) << 8)
+                info["preferred_mode"] = f"{h_active}x{v_active}"
+                if h_total and v_total:
+                    info["preferred_refresh_hz"] = round(pixel_clock * 10_000 / (h_total * v_total), 2)
+        else:
+            tag = edid[offset + 3]
+            text = edid[offset + 5:offset + 18].split(b"\n", 1)[0].decode("ascii", "ignore").strip()
+            if tag == 0xFC and text:
+                info["name"] = text
+            elif tag == 0xFF and text:
+                info["serial"] = text
+
+    return info
+
 
 class HDMICableTester:
     """Main HDMI cable testing class"""
 
+    # Single-pass xrandr scanner, compiled once. Each alternative is wrapped in
+    # an outer named group so match.lastgroup says which one matched, and each
+    # stops at the end of its line ([^\n]*), so a failed match never
+    # backtracks across the output.
+    _XRANDR_SCANNER = re.compile(
+        r'^(?P<connected>(?P<port>\S+) connected(?P<connected_rest>[^\n]*))$'
+        r'|^(?P<header>\S[^\n]*)$'
+        r'|^(?P<edid>[ \t]+EDID:[ \t]*\n(?P<edid_hex>(?:[ \t]+[0-9a-fA-F]+[ \t]*(?:\n|$))+))'
+        r'|^(?P<mode>[ \t]+(?P<mode_name>\d+x\d+\S*)(?P<mode_rest>[^\n]*))$',
+        re.M
+    )
+    # Current geometry and rotation, e.g. "1080x1920+0+0 (0x48) left (normal left ...)".
+    # The rotation is the bare word after the geometry, never the list of
+    # supported rotations in parentheses.
+    _GEOMETRY_RE = re.compile(
+        r'(?P<geometry>\d+x\d+\+\d+\+\d+)(?: \(0x[0-9a-f]+\))?(?: (?P<rotation>normal|left|right|inverted)\b)?'
+    )
+
     def __init__(self):
         self.platform = platform.system()
         self.is_windows = self.platform == "Windows"
@@ -40,86 +155,228 @@ class HDMICableTester:
             "tests": [],
             "overall_quality": "Unknown"
         }
+        self._ansi = self._enable_ansi_escapes()
+        self._ps_args = ["powershell", "-NoProfile", "-NonInteractive", "-NoLogo", "-Command"]
+        self._ps = None
+        self._ps_lines = None
+        # Stability results whose samples are still in a temp file
+        self._pending_samples = []
+        self._modes = None
+        self._wmi_services = None
+        self._wmi_tried = False
+
+    def __del__(self):
+        self.close()
+        self._discard_pending_samples()
+
+    def close(self):
+        """Shut down the persistent PowerShell session, if one was started"""
+        ps = getattr(self, "_ps", None)
+        if ps is None:
+            return
+        self._ps = None
+        try:
+            ps.stdin.close()
+            ps.wait(timeout=2)
+        except Exception:
+            ps.kill()
+
+    def _ps_session_query(self, command: str, timeout: float = PS_SESSION_TIMEOUT) -> str:
+        """Run a command in a long-lived PowerShell session and return its output
+
+        Starting powershell.exe costs far more than a small CIM query, so
+        repeated polls share one process fed over stdin. Each command is
+        followed by a sentinel line that marks the end of its output. If the
+        output doesn't arrive within timeout seconds the session is killed
+        and the next call starts a fresh one.
+        """
+        if self._ps is None or self._ps.poll() is not None:
+            self._ps = subprocess.Popen(
+                self._ps_args + ["-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+            # Read stdout on a helper thread so waits for output can time out
+            self._ps_lines = queue.Queue()
+            threading.Thread(
+                target=_pump_lines,
+                args=(self._ps.stdout, self._ps_lines),
+                daemon=True
+            ).start()
+
+        self._ps.stdin.write(f"{command}\n'{PS_SENTINEL}'\n")
+        self._ps.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        lines = []
+        while True:
+            try:
+                line = self._ps_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self._ps.kill()
+                self._ps = None
+                raise TimeoutError(f"PowerShell session did not answer within {timeout} seconds")
+            if line is None:
+                # Session died; drop it so the next call starts a fresh one
+                self.close()
+                raise RuntimeError("PowerShell session exited unexpectedly")
+            line = line.strip()
+            if line == PS_SENTINEL:
+                break
+            lines.append(line)
+
+        return "\n".join(lines)
+
+    def _enable_ansi_escapes(self) -> bool:
+        """Turn on VT escape processing for the Windows console (always on elsewhere)"""
+        if not self.is_windows:
+            return True
+
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+        except (AttributeError, OSError):
+            return False
 
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if self.is_windows else 'clear')
+        if self._ansi:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
+        else:
+            # Consoles without VT support (pre-Windows 10)
+            os.system('cls' if self.is_windows else 'clear')
 
     def print_header(self):
         """Print application header"""
-        print("=" * 70)
-        print("HDMI CABLE QUALITY TESTER".center(70))
-        print("=" * 70)
+        print(BAR)
+        print(f"{'HDMI CABLE QUALITY TESTER':^{REPORT_WIDTH}}")
+        print(BAR)
         print(f"Platform: {self.platform}")
         print(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70)
+        print(BAR)
         print()
 
-    def detect_displays_windows(self) -> List[Dict]:
-        """Detect displays on Windows using WMI and PowerShell"""
-        displays = []
-
-        try:
-            # Try using PowerShell to get display information
-            ps_script = """
-            Get-CimInstance -Namespace root\\wmi -ClassName WmiMonitorID | ForEach-Object {
-                $name = ($_.UserFriendlyName | Where-Object {$_ -ne 0}) -join '' | ForEach-Object {[char]$_} | Out-String
-                $serial = ($_.SerialNumberID | Where-Object {$_ -ne 0}) -join '' | ForEach-Object {[char]$_} | Out-String
-                $manufacturer = ($_.ManufacturerName | Where-Object {$_ -ne 0}) -join '' | ForEach-Object {[char]$_} | Out-String
-
-                [PSCustomObject]@{
-                    Name = $name.Trim()
-                    Serial = $serial.Trim()
-                    Manufacturer = $manufacturer.Trim()
-                }
-            } | ConvertTo-Json
+    def _get_wmi_services(self):
+        """Connect to root\\cimv2 in-process via pywin32, or return None if unavailable"""
+        if not self._wmi_tried:
+            self._wmi_tried = True
+            try:
+                # Imported here so runs that never poll WMI skip loading COM
+                import win32com.client
+                locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+                self._wmi_services = locator.ConnectServer(".", "root\\cimv2")
+            except Exception:
+                # pywin32 is Windows-only; PowerShell is used instead
+                self._wmi_services = None
+
+        return self._wmi_services
+
+    def count_desktop_monitors(self) -> int:
+        """Count Win32_DesktopMonitor instances, in-process when pywin32 is installed"""
+        services = self._get_wmi_services()
+        if services is not None:
+            from pywintypes import com_error
+            try:
+                # Forward-only enumerators have no .Count, so count while iterating
+                monitors = services.ExecQuery(
+                    "SELECT Name FROM Win32_DesktopMonitor",
+                    "WQL",
+                    WBEM_FLAG_FORWARD_ONLY | WBEM_FLAG_RETURN_IMMEDIATELY
+                )
+                return sum(1 for _ in monitors)
+            except com_error:
+                # Stop using the broken COM connection; poll through PowerShell
+                self._wmi_services = None
+
+        output = self._ps_session_query(
+            "@(Get-CimInstance -ClassName Win32_DesktopMonitor -Property Name).Count"
+        )
+        return int(output) if output.isdigit() else 0
+
+    def get_display_modes(self) -> List[Dict]:
+        """Get the display modes reported by Get-DisplayMode (queried once, then cached)"""
+        if self._modes is None:
+            ps_modes = """
+            Get-DisplayMode | Select-Object Width, Height, RefreshRate | ConvertTo-Json
             """
 
             result = subprocess.run(
-                ["powershell", "-Command", ps_script],
+                self._ps_args + [ps_modes],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
 
+            modes = []
             if result.returncode == 0 and result.stdout.strip():
-                try:
-                    data = json.loads(result.stdout)
-                    if isinstance(data, list):
-                        displays.extend(data)
-                    else:
-                        displays.append(data)
-                except json.JSONDecodeError:
-                    pass
+                data = json.loads(result.stdout)
+                modes = data if isinstance(data, list) else [data]
 
-            # Get display modes
-            ps_modes = """
-            Get-DisplayMode | Select-Object Width, Height, RefreshRate | ConvertTo-Json
+            self._modes = modes
+
+        return self._modes
+
+    def detect_displays_windows(self) -> List[Dict]:
+        """Detect displays on Windows using CIM and PowerShell"""
+        displays = []
+
+        try:
+            # Try using PowerShell to get display information
+            ps_script = """
+            Get-CimInstance -Namespace root\\wmi -ClassName WmiMonitorID -Property UserFriendlyName, SerialNumberID, ManufacturerName |
+                Select-Object UserFriendlyName, SerialNumberID, ManufacturerName | ConvertTo-Json
             """
 
-            result = subprocess.run(
-                ["powershell", "-Command", ps_modes],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # The monitor and mode queries are independent, so run both
+            # PowerShell processes at once and overlap their startup time
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                monitors_future = executor.submit(
+                    subprocess.run,
+                    self._ps_args + [ps_script],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                modes_future = executor.submit(self.get_display_modes)
+                result = monitors_future.result()
 
             if result.returncode == 0 and result.stdout.strip():
                 try:
-                    modes_data = json.loads(result.stdout)
-                    if displays:
-                        displays[0]['current_mode'] = modes_data
+                    data = json.loads(result.stdout)
+                    for monitor in data if isinstance(data, list) else [data]:
+                        displays.append({
+                            "Name": decode_wmi_string(monitor.get("UserFriendlyName")),
+                            "Serial": decode_wmi_string(monitor.get("SerialNumberID")),
+                            "Manufacturer": decode_wmi_string(monitor.get("ManufacturerName"))
+                        })
                 except json.JSONDecodeError:
                     pass
 
+            # Get display modes
+            try:
+                modes_data = modes_future.result()
+                if displays and modes_data:
+                    displays[0]['current_mode'] = modes_data
+            except json.JSONDecodeError:
+                pass
+
         except Exception as e:
-            print(f"⚠ Warning: Could not detect displays via WMI: {e}")
+            print(f"⚠ Warning: Could not detect displays via CIM: {e}")
 
         # Fallback: Use basic display detection
         if not displays:
             try:
                 result = subprocess.run(
-                    ["powershell", "-Command", "Get-CimInstance -ClassName Win32_DesktopMonitor | Select-Object Name, ScreenWidth, ScreenHeight | ConvertTo-Json"],
+                    self._ps_args + ["Get-CimInstance -ClassName Win32_DesktopMonitor -Property Name, ScreenWidth, ScreenHeight | Select-Object Name, ScreenWidth, ScreenHeight | ConvertTo-Json"],
                     capture_output=True,
                     text=True,
                     timeout=10
@@ -146,12 +403,11 @@ class HDMICableTester:
 
         try:
             # Check if running in WSL
-            result = subprocess.run(
-                ["cat", "/proc/version"],
-                capture_output=True,
-                text=True
-            )
-            is_wsl = "microsoft" in result.stdout.lower()
+            try:
+                with open("/proc/version") as f:
+                    is_wsl = "microsoft" in f.read().lower()
+            except OSError:
+                is_wsl = False
 
             if is_wsl:
                 print("ℹ Running in WSL. Display detection may be limited.")
@@ -167,30 +423,51 @@ class HDMICableTester:
             )
 
             if result.returncode == 0:
-                current_display = None
-                for line in result.stdout.split('\n'):
-                    if " connected" in line:
-                        parts = line.split()
-                        current_display = {
-                            "port": parts[0],
+                display = None
+                for token in self._XRANDR_SCANNER.finditer(result.stdout):
+                    kind = token.lastgroup
+                    if kind == "connected":
+                        display = {
+                            "port": token.group("port"),
                             "connected": True,
                             "modes": []
                         }
-                        displays.append(current_display)
-                    elif current_display and "x" in line and "+" in line:
-                        # Parse resolution line
-                        parts = line.strip().split()
-                        if parts:
-                            mode = parts[0]
-                            current_display["modes"].append(mode)
-                            if "*" in line:
-                                current_display["current_mode"] = mode
+
+                        geometry = self._GEOMETRY_RE.search(token.group("connected_rest"))
+                        if geometry:
+                            display["geometry"] = geometry.group("geometry")
+                            display["rotation"] = geometry.group("rotation") or "normal"
+
+                        displays.append(display)
+                    elif kind == "header":
+                        # Disconnected output or screen line; skip its details
+                        display = None
+                    elif display is None:
+                        continue
+                    elif kind == "mode":
+                        mode = token.group("mode_name")
+                        display["modes"].append(mode)
+                        if "*" in token.group("mode_rest"):
+                            display["current_mode"] = mode
+                    elif kind == "edid":
+                        display["edid"] = "".join(token.group("edid_hex").split())
+
+                for display in displays:
+                    if "edid" in display:
+                        try:
+                            display.update(parse_edid(bytes.fromhex(display["edid"])))
+                        except ValueError:
+                            pass
 
         except FileNotFoundError:
             print("⚠ xrandr not found. Please install: sudo apt-get install x11-xserver-utils")
         except Exception as e:
             print(f"⚠ Warning: Could not detect displays: {e}")
 
+        # Without X, the kernel still exposes connected outputs and their EDID
+        if not displays:
+            displays = self.detect_displays_sysfs()
+
         if not displays:
             displays.append({
                 "Note": "No displays detected. Make sure X server is running (for WSL) or run on Windows."
@@ -198,10 +475,40 @@ class HDMICableTester:
 
         return displays
 
+    def detect_displays_sysfs(self) -> List[Dict]:
+        """Detect displays on Linux by reading EDID from /sys/class/drm"""
+        displays = []
+
+        for status_path in sorted(glob.glob("/sys/class/drm/card*-*/status")):
+            connector = os.path.dirname(status_path)
+            try:
+                with open(status_path) as f:
+                    if f.read().strip() != "connected":
+                        continue
+                with open(os.path.join(connector, "edid"), "rb") as f:
+                    edid = f.read()
+            except OSError:
+                continue
+
+            display = {
+                "port": os.path.basename(connector).split("-", 1)[1],
+                "connected": True
+            }
+            if edid:
+                try:
+                    display.update(parse_edid(edid))
+                except ValueError:
+                    pass
+
+            displays.append(display)
+
+        return displays
+
     def detect_displays(self) -> List[Dict]:
         """Detect connected displays"""
         print("📺 Detecting connected displays...")
 
+        self._modes = None
         if self.is_windows:
             displays = self.detect_displays_windows()
         else:
@@ -228,39 +535,34 @@ class HDMICableTester:
             (1280, 720),   # 720p
         ]
 
+        # On Windows, check available modes via PowerShell
+        supported_resolutions = set()
+        modes_error = None
+        if self.is_windows:
+            try:
+                supported_resolutions = {(m.get("Width"), m.get("Height"))
+                                         for m in self.get_display_modes()}
+            except Exception as e:
+                modes_error = e
+
         for width, height in standard_resolutions:
             res_name = f"{width}x{height}"
             print(f"  Testing {res_name}...", end=" ")
 
-            # On Windows, check available modes via PowerShell
             if self.is_windows:
-                try:
-                    ps_script = f"""
-                    $modes = Get-DisplayMode
-                    $match = $modes | Where-Object {{ $_.Width -eq {width} -and $_.Height -eq {height} }}
-                    if ($match) {{ Write-Output "supported" }} else {{ Write-Output "not_supported" }}
-                    """
-
-                    result = subprocess.run(
-                        ["powershell", "-Command", ps_script],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    supported = "supported" in result.stdout.lower()
+                if modes_error is None:
+                    supported = (width, height) in supported_resolutions
                     test_result["resolutions_tested"].append({
                         "resolution": res_name,
                         "supported": supported
                     })
                     print("✓ Supported" if supported else "✗ Not supported")
-
-                except Exception as e:
-                    print(f"⚠ Error: {e}")
+                else:
+                    print(f"⚠ Error: {modes_error}")
                     test_result["resolutions_tested"].append({
                         "resolution": res_name,
                         "supported": False,
-                        "error": str(e)
+                        "error": str(modes_error)
                     })
             else:
                 # On Linux, check xrandr output
@@ -287,37 +589,31 @@ class HDMICableTester:
 
         standard_rates = [60, 75, 120, 144, 240]
 
+        supported_rates = set()
+        modes_error = None
+        if self.is_windows:
+            try:
+                supported_rates = {m.get("RefreshRate") for m in self.get_display_modes()}
+            except Exception as e:
+                modes_error = e
+
         for rate in standard_rates:
             print(f"  Testing {rate}Hz...", end=" ")
 
             if self.is_windows:
-                try:
-                    ps_script = f"""
-                    $modes = Get-DisplayMode
-                    $match = $modes | Where-Object {{ $_.RefreshRate -eq {rate} }}
-                    if ($match) {{ Write-Output "supported" }} else {{ Write-Output "not_supported" }}
-                    """
-
-                    result = subprocess.run(
-                        ["powershell", "-Command", ps_script],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    supported = "supported" in result.stdout.lower()
+                if modes_error is None:
+                    supported = rate in supported_rates
                     test_result["refresh_rates_tested"].append({
                         "refresh_rate": f"{rate}Hz",
                         "supported": supported
                     })
                     print("✓ Supported" if supported else "✗ Not supported")
-
-                except Exception as e:
-                    print(f"⚠ Error: {e}")
+                else:
+                    print(f"⚠ Error: {modes_error}")
                     test_result["refresh_rates_tested"].append({
                         "refresh_rate": f"{rate}Hz",
                         "supported": False,
-                        "error": str(e)
+                        "error": str(modes_error)
                     })
             else:
                 print("⊘ Simulated (requires active session)")
@@ -329,52 +625,94 @@ class HDMICableTester:
         self.test_results["tests"].append(test_result)
         return test_result
 
-    def test_signal_stability(self, duration: int = 10) -> Dict:
-        """Monitor signal stability over time"""
+    def test_signal_stability(self, duration: int = 10, samples_file: Optional[str] = None) -> Dict:
+        """Monitor signal stability over time
+
+        Samples are appended to a JSON Lines file as they are collected
+        rather than kept in memory; the test result only records the counts
+        and the file name. Without samples_file they go to a temp file that
+        save_report() moves next to the report.
+        """
         print(f"\n📡 Testing signal stability ({duration} seconds)...")
 
         test_result = {
             "test_name": "Signal Stability Test",
             "timestamp": datetime.now().isoformat(),
             "duration_seconds": duration,
-            "samples": [],
+            "samples_file": None,
+            "samples_collected": 0,
+            "disconnections": 0,
+            "errors": 0,
             "passed": True
         }
 
         print("  Monitoring for disconnections and errors...")
 
-        for i in range(duration):
-            print(f"  Progress: {'█' * (i + 1)}{'░' * (duration - i - 1)} {i + 1}/{duration}s", end="\r")
-
-            # Check if display is still connected
-            if self.is_windows:
-                try:
-                    result = subprocess.run(
-                        ["powershell", "-Command", "Get-CimInstance -ClassName Win32_DesktopMonitor | Measure-Object | Select-Object -ExpandProperty Count"],
-                        capture_output=True,
-                        text=True,
-                        timeout=2
+        samples_fp = None
+        if self.is_windows:
+            try:
+                if samples_file is None:
+                    samples_fp = tempfile.NamedTemporaryFile(
+                        "w", prefix="hdmi_samples_", suffix=".jsonl", delete=False
                     )
+                    self._pending_samples.append(test_result)
+                else:
+                    samples_fp = open(samples_file, "w")
+                test_result["samples_file"] = samples_fp.name
+            except OSError as e:
+                print(f"  ⚠ Could not open samples file, keeping counts only: {e}")
 
-                    count = int(result.stdout.strip()) if result.stdout.strip().isdigit() else 0
-                    test_result["samples"].append({
-                        "time": i,
-                        "displays_connected": count,
-                        "stable": count > 0
-                    })
-
-                    if count == 0:
-                        test_result["passed"] = False
-
-                except Exception:
-                    test_result["samples"].append({
-                        "time": i,
-                        "error": "Could not check connection"
-                    })
+        try:
+            # Sample on a fixed one-second schedule so query time is absorbed
+            # into each tick instead of stretching the test
+            full_bar = "█" * duration
+            empty_bar = "░" * duration
+            next_tick = time.monotonic()
+            for i in range(duration):
+                next_tick += 1.0
+                print(f"  Progress: {full_bar[:i + 1]}{empty_bar[i + 1:]} {i + 1}/{duration}s", end="\r", flush=True)
+
+                # Check if display is still connected
+                if self.is_windows:
+                    try:
+                        count = self.count_desktop_monitors()
+                        sample = {
+                            "time": i,
+                            "displays_connected": count,
+                            "stable": count > 0
+                        }
 
-            time.sleep(1)
+                        if count == 0:
+                            test_result["disconnections"] += 1
+                            test_result["passed"] = False
 
+                    except Exception:
+                        sample = {
+                            "time": i,
+                            "error": "Could not check connection"
+                        }
+                        test_result["errors"] += 1
+
+                    test_result["samples_collected"] += 1
+                    if samples_fp is not None:
+                        try:
+                            samples_fp.write(json.dumps(sample) + "\n")
+                        except OSError as e:
+                            print(f"\n  ⚠ Could not write samples file, keeping counts only: {e}")
+                            samples_fp.close()
+                            samples_fp = None
+
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+        finally:
+            if samples_fp is not None:
+                samples_fp.close()
+
+        self.close()
+        # Displays may have changed during a long test; re-read modes next time
+        self._modes = None
         print(f"\n  Completed: {duration} samples collected")
+        if samples_file is not None and test_result["samples_file"]:
+            print(f"  Samples written to: {samples_file}")
 
         if test_result["passed"]:
             print("  ✓ No disconnections detected")
@@ -423,28 +761,18 @@ class HDMICableTester:
             (3840, 2160, 120, "4K@120Hz"),
         ]
 
-        hdmi_versions = {
-            "HDMI 1.4": 10.2,
-            "HDMI 2.0": 18.0,
-            "HDMI 2.1": 48.0
-        }
-
         print("\n  Resolution/Rate      Bandwidth    HDMI 1.4  HDMI 2.0  HDMI 2.1")
-        print("  " + "-" * 66)
+        print(TABLE_RULE)
 
         for width, height, rate, name in test_scenarios:
             bandwidth = self.calculate_bandwidth_requirement(width, height, rate)
 
-            compatible = []
-            for version, max_bw in hdmi_versions.items():
-                if bandwidth <= max_bw:
-                    compatible.append(version)
-
-            hdmi_14 = "✓" if bandwidth <= 10.2 else "✗"
-            hdmi_20 = "✓" if bandwidth <= 18.0 else "✗"
-            hdmi_21 = "✓" if bandwidth <= 48.0 else "✗"
+            # Index of the first (oldest) version with enough bandwidth
+            first = bisect_left(HDMI_MAX_BANDWIDTHS, bandwidth)
+            compatible = [version for version, _ in HDMI_VERSIONS[first:]]
+            marks = "  ".join(f"{'✗' if i < first else '✓':^8}" for i in range(len(HDMI_VERSIONS)))
 
-            print(f"  {name:20} {bandwidth:6.2f} Gbps    {hdmi_14:^8}  {hdmi_20:^8}  {hdmi_21:^8}")
+            print(f"  {name:20} {bandwidth:6.2f} Gbps    {marks}")
 
             test_result["bandwidth_tests"].append({
                 "scenario": name,
@@ -481,31 +809,31 @@ class HDMICableTester:
     def generate_report(self) -> str:
         """Generate a detailed test report"""
         report = []
-        report.append("\n" + "=" * 70)
-        report.append("HDMI CABLE TEST REPORT".center(70))
-        report.append("=" * 70)
+        report.append("\n" + BAR)
+        report.append(f"{'HDMI CABLE TEST REPORT':^{REPORT_WIDTH}}")
+        report.append(BAR)
         report.append(f"\nTest Date: {self.test_results['timestamp']}")
         report.append(f"Platform: {self.test_results['platform']}")
         report.append(f"\nOverall Cable Quality: {self.test_results['overall_quality']}")
-        report.append("\n" + "-" * 70)
+        report.append("\n" + DASH)
 
         # Display information
         report.append("\n📺 DETECTED DISPLAYS:")
         for i, display in enumerate(self.test_results["displays"], 1):
             report.append(f"\n  Display {i}:")
             for key, value in display.items():
-                if key != "modes":
+                if key not in ("modes", "edid"):
                     report.append(f"    {key}: {value}")
 
         # Test results
-        report.append("\n" + "-" * 70)
+        report.append("\n" + DASH)
         report.append("\n📊 TEST RESULTS:")
         for test in self.test_results["tests"]:
             report.append(f"\n  • {test['test_name']}")
             report.append(f"    Status: {'✓ PASSED' if test.get('passed', True) else '✗ FAILED'}")
             report.append(f"    Time: {test['timestamp']}")
 
-        report.append("\n" + "=" * 70)
+        report.append("\n" + BAR)
 
         return "\n".join(report)
 
@@ -515,12 +843,33 @@ class HDMICableTester:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"hdmi_test_report_{timestamp}.json"
 
+        # Move stability samples from their temp files to sit beside the report
+        base = os.path.splitext(filename)[0]
+        for n, test_result in enumerate(self._pending_samples, 1):
+            samples_file = f"{base}.jsonl" if n == 1 else f"{base}_{n}.jsonl"
+            try:
+                shutil.move(test_result["samples_file"], samples_file)
+                test_result["samples_file"] = samples_file
+            except OSError as e:
+                print(f"⚠ Warning: Could not move stability samples: {e}")
+        self._pending_samples = []
+
         with open(filename, 'w') as f:
             json.dump(self.test_results, f, indent=2)
 
         print(f"\n💾 Report saved to: {filename}")
         return filename
 
+    def _discard_pending_samples(self):
+        """Delete temp sample files that were never saved with a report"""
+        for test_result in getattr(self, "_pending_samples", ()):
+            try:
+                os.remove(test_result["samples_file"])
+            except OSError:
+                pass
+            test_result["samples_file"] = None
+        self._pending_samples = []
+
     def run_full_test(self):
         """Run complete HDMI cable test suite"""
         self.clear_screen()